@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+"""
+Apply the bento grid and v2.5 dashboard updates to index.js with a single read and write
+"""
+
+from markers import apply_to_file
+from update_dashboard import update_bento
+from update_dashboard_v2 import update_v2
+
+if __name__ == '__main__':
+    # Both edits run against one mapping of the file; the result is written back once, if at all
+    apply_to_file('index.js', lambda content: update_v2(update_bento(content)))
+
+    print("Done!")
@@ -0,0 +1,81 @@
+"""
+Fixed markers, block templates, matching helpers and file I/O shared by the index.js update scripts
+"""
+
+import contextlib
+import functools
+import mmap
+import os
+import re
+import shutil
+from pathlib import Path
+
+TEMPLATES_DIR = Path(__file__).parent / 'templates'
+
+DASHBOARD_START = b'<!-- Dashboard Content -->'
+DASHBOARD_END = b'</div><!-- end dashboard-content -->'
+
+# Short literal required by the bento block; cheap to find, so it gates the full block compare
+BENTO_ANCHOR = b'bento-countdown'
+
+
+@functools.lru_cache(maxsize=None)
+def load_template(name):
+    """Return the raw bytes of a block from templates/, without the file's trailing newline"""
+    return (TEMPLATES_DIR / name).read_bytes().removesuffix(b'\n')
+
+
+@functools.lru_cache(maxsize=64)
+def marker_pattern(markers):
+    """Compile an alternation matching any of `markers`, once per marker set"""
+    return re.compile(b'|'.join(re.escape(m) for m in markers))
+
+
+def scan_markers(content, markers):
+    """Return the first offset of each marker (-1 if absent), found in a single pass over `content`
+
+    finditer() never reports overlapping matches, so the markers must not be able to overlap: none may
+    contain another, and no marker may end with the start of another.
+    """
+    hits = {}
+    for match in marker_pattern(markers).finditer(content):
+        hits.setdefault(match.group(), match.start())
+        if len(hits) == len(markers):
+            break
+    return {m: hits.get(m, -1) for m in markers}
+
+
+def locate(content, anchor, block, idx=0):
+    """Return the offset of `block` in `content`, found via a short anchor it contains, or -1"""
+    offset = block.find(anchor)
+    idx = content.find(anchor, idx)
+    while idx != -1:
+        start = idx - offset
+        if start >= 0 and memoryview(content)[start:start + len(block)] == block:
+            return start
+        idx = content.find(anchor, idx + 1)
+    return -1
+
+
+def apply_to_file(path, update):
+    """Run `update` over a read-only mapping of `path` and atomically swap in the bytes it returns
+
+    The file is left untouched when the result is identical to its contents; returns whether it changed.
+    """
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+        data = update(content)
+        if data is content or (len(data) == len(content) and memoryview(content) == data):
+            return False
+    # Write beside the original and rename over it, so readers never see a half-written file; the new
+    # inode is created with the umask, so carry the original permission bits over before the swap
+    tmp = path + '.tmp'
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        shutil.copymode(path, tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp)
+        raise
+    return True